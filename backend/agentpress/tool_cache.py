@@ -5,6 +5,7 @@ This module provides caching functionality for tool execution results,
 reducing API costs and improving response times for repeated operations.
 """
 
+import asyncio
 import hashlib
 import json
 import time
@@ -12,9 +13,19 @@ from functools import wraps
 from typing import Any, Dict, Optional, Callable, Union
 from datetime import datetime, timedelta
 
-from services.redis import RedisClient
+import orjson
+
+from services.redis import RedisClient, REDIS_BATCH_SIZE
 from utils.logger import logger
 
+# orjson is only used for the cache key payload, where lossy output (NaN
+# written as null) can at worst collide keys. Cached values go through json
+# so hits round-trip big integers and non-finite floats exactly like misses.
+_PARAMS_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Redis set of tool names that have stats hashes, so global stats never scan
+_STATS_REGISTRY_KEY = "tool_cache_stats:tools"
+
 
 class ToolCache:
     """Manages caching for tool execution results."""
@@ -33,6 +44,8 @@ class ToolCache:
             'misses': 0,
             'errors': 0
         }
+        # Strong references to fire-and-forget stat updates until they finish
+        self._background_tasks = set()
         
         if not self._cache_enabled:
             logger.warning("Tool caching disabled - Redis client not available")
@@ -48,13 +61,28 @@ class ToolCache:
             A unique cache key string
         """
         # Sort params for consistent hashing
-        sorted_params = json.dumps(params, sort_keys=True)
-        content = f"{tool_name}:{sorted_params}"
+        try:
+            sorted_params = orjson.dumps(params, option=_PARAMS_OPTIONS)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits
+            sorted_params = json.dumps(params, sort_keys=True).encode()
+        content = tool_name.encode() + b":" + sorted_params
         
-        # Create hash for more efficient storage
-        hash_object = hashlib.sha256(content.encode())
+        # 128-bit BLAKE2b is faster than SHA-256 and halves the key length
+        hash_object = hashlib.blake2b(content, digest_size=16)
         return f"tool_cache:{tool_name}:{hash_object.hexdigest()}"
     
+    def _generate_stats_key(self, tool_name: str) -> str:
+        """Generate the Redis hash key holding shared stats for a tool.
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            The stats hash key string
+        """
+        return f"tool_cache_stats:{tool_name}"
+    
     async def get(self, tool_name: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Retrieve cached result for tool execution.
         
@@ -70,21 +98,47 @@ class ToolCache:
             
         try:
             cache_key = self._generate_cache_key(tool_name, params)
-            cached_data = await self.redis.get(cache_key)
+            stats_key = self._generate_stats_key(tool_name)
+            
+            # Count the lookup and register the tool in Redis in the same
+            # round trip as the GET so stats are shared across workers at no
+            # extra latency
+            pipe = await self.redis.pipeline(transaction=False)
+            async with pipe:
+                pipe.get(cache_key)
+                pipe.hincrby(stats_key, 'lookups', 1)
+                pipe.sadd(_STATS_REGISTRY_KEY, tool_name)
+                cached_data, _, _ = await pipe.execute()
             
             if cached_data:
                 self._stats['hits'] += 1
-                logger.debug(f"Cache hit for {tool_name} with key {cache_key}")
+                logger.debug("Cache hit for %s with key %s", tool_name, cache_key)
                 return json.loads(cached_data)
             else:
                 self._stats['misses'] += 1
+                # Whether the lookup missed is only known after the GET, so
+                # count it in the background rather than delay the tool call
+                task = asyncio.create_task(self._record_miss(stats_key))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
                 return None
                 
         except Exception as e:
             self._stats['errors'] += 1
-            logger.error(f"Error retrieving from cache: {e}")
+            logger.error("Error retrieving from cache: %s", e)
             return None
     
+    async def _record_miss(self, stats_key: str) -> None:
+        """Increment the shared miss counter for a tool.
+        
+        Args:
+            stats_key: Redis hash key holding the tool's stats
+        """
+        try:
+            await self.redis.hincrby(stats_key, 'misses', 1)
+        except Exception as e:
+            logger.warning("Error recording cache miss: %s", e)
+    
     async def set(
         self, 
         tool_name: str, 
@@ -120,12 +174,12 @@ class ToolCache:
                 ex=ttl
             )
             
-            logger.debug(f"Cached result for {tool_name} with key {cache_key} (TTL: {ttl}s)")
+            logger.debug("Cached result for %s with key %s (TTL: %ss)", tool_name, cache_key, ttl)
             return True
             
         except Exception as e:
             self._stats['errors'] += 1
-            logger.error(f"Error setting cache: {e}")
+            logger.error("Error setting cache: %s", e)
             return False
     
     async def invalidate(self, tool_name: str, params: Optional[Dict[str, Any]] = None) -> bool:
@@ -147,24 +201,81 @@ class ToolCache:
                 # Invalidate specific cache entry
                 cache_key = self._generate_cache_key(tool_name, params)
                 await self.redis.delete(cache_key)
-                logger.info(f"Invalidated cache for {tool_name} with specific params")
+                logger.info("Invalidated cache for %s with specific params", tool_name)
             else:
                 # Invalidate all entries for this tool
                 # Note: This requires scanning keys which can be expensive
                 pattern = f"tool_cache:{tool_name}:*"
-                keys = await self.redis.scan_iter(match=pattern)
+                keys = []
+                deleted = 0
+                async for key in self.redis.scan_iter(match=pattern):
+                    keys.append(key)
+                    if len(keys) >= REDIS_BATCH_SIZE:
+                        deleted += await self.redis.delete_many(keys)
+                        keys = []
                 if keys:
-                    await self.redis.delete(*keys)
-                    logger.info(f"Invalidated all cache entries for {tool_name}")
+                    deleted += await self.redis.delete_many(keys)
+                if deleted:
+                    logger.info("Invalidated all cache entries for %s", tool_name)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error invalidating cache: {e}")
+            logger.error("Error invalidating cache: %s", e)
             return False
     
+    async def get_global_stats(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
+        """Get cache statistics aggregated across all workers.
+        
+        Args:
+            tool_name: Optional tool name. If None, aggregates over all tools.
+            
+        Returns:
+            Dictionary containing shared cache statistics
+        """
+        stats = {
+            'enabled': self._cache_enabled,
+            'hits': 0,
+            'misses': 0,
+            'hit_rate': 0.0,
+            'total_requests': 0
+        }
+        if not self._cache_enabled:
+            return stats
+            
+        try:
+            if tool_name:
+                tool_names = [tool_name]
+            else:
+                tool_names = await self.redis.smembers(_STATS_REGISTRY_KEY)
+            stats_keys = [self._generate_stats_key(name) for name in tool_names]
+            
+            pipe = await self.redis.pipeline(transaction=False)
+            async with pipe:
+                for stats_key in stats_keys:
+                    pipe.hgetall(stats_key)
+                rows = await pipe.execute()
+            
+            total = sum(int(row.get('lookups', 0)) for row in rows)
+            misses = sum(int(row.get('misses', 0)) for row in rows)
+            hits = max(total - misses, 0)
+            hit_rate = hits / total if total > 0 else 0
+            
+            stats.update({
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': round(hit_rate * 100, 2),
+                'total_requests': total
+            })
+            
+        except Exception as e:
+            logger.error("Error retrieving global cache stats: %s", e)
+            stats['error'] = str(e)
+            
+        return stats
+    
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics.
+        """Get cache statistics for this process.
         
         Returns:
             Dictionary containing cache statistics
@@ -225,7 +336,7 @@ def cache_tool_result(
             cached_result = await self._cache.get(tool_name, cache_params)
             
             if cached_result:
-                logger.info(f"Returning cached result for {tool_name}")
+                logger.info("Returning cached result for %s", tool_name)
                 return cached_result['result']
             
             # Execute the tool
@@ -246,7 +357,10 @@ def cache_tool_result(
                 
                 # Cache the result
                 await self._cache.set(tool_name, cache_params, result, cache_ttl)
-                logger.info(f"Cached {tool_name} result (execution: {execution_time:.2f}s, TTL: {cache_ttl}s)")
+                logger.info(
+                    "Cached %s result (execution: %.2fs, TTL: %ss)",
+                    tool_name, execution_time, cache_ttl
+                )
             
             return result
             
@@ -271,7 +385,7 @@ def get_tool_cache() -> ToolCache:
             redis_client = get_redis_client()
             _tool_cache_instance = ToolCache(redis_client)
         except Exception as e:
-            logger.warning(f"Failed to initialize Redis for tool cache: {e}")
+            logger.warning("Failed to initialize Redis for tool cache: %s", e)
             _tool_cache_instance = ToolCache(None)
     
     return _tool_cache_instance
\ No newline at end of file
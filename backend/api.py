@@ -164,10 +164,12 @@ async def get_cache_metrics():
         from agentpress.tool_cache import get_tool_cache
         cache = get_tool_cache()
         metrics = cache.get_stats()
+        global_metrics = await cache.get_global_stats()
         
         return {
             "status": "ok",
             "metrics": metrics,
+            "global_metrics": global_metrics,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     except Exception as e:
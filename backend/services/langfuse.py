@@ -1,5 +1,4 @@
 import os
-from langfuse import Langfuse
 
 public_key = os.getenv("LANGFUSE_PUBLIC_KEY")
 secret_key = os.getenv("LANGFUSE_SECRET_KEY")
@@ -12,6 +11,9 @@ if public_key and secret_key:
 # Initialize Langfuse without the 'enabled' parameter
 # Langfuse will be disabled if keys are not provided
 if enabled:
+    # Only pay for the langfuse import tree when tracing is configured
+    from langfuse import Langfuse
+
     langfuse = Langfuse(
         public_key=public_key,
         secret_key=secret_key,
@@ -3,20 +3,24 @@ import os
 from dotenv import load_dotenv
 import asyncio
 from utils.logger import logger
-from typing import List, Any
+from typing import List, Any, Dict, Iterable
 
 # Redis client
 client = None
+pool = None
 _initialized = False
+_ready_client = None  # Set only once the connection has been verified
 _init_lock = asyncio.Lock()
 
 # Constants
 REDIS_KEY_TTL = 3600 * 24  # 24 hour TTL as safety mechanism
+REDIS_POOL_TIMEOUT = 20  # Seconds to wait for a free connection when REDIS_POOL caps the pool
+REDIS_BATCH_SIZE = 500  # Max commands per pipeline flush for batch helpers
 
 
 def initialize():
     """Initialize Redis connection using environment variables."""
-    global client
+    global client, pool
 
     # Load environment variables if not already loaded
     load_dotenv()
@@ -28,28 +32,46 @@ def initialize():
     # Convert string 'True'/'False' to boolean
     redis_ssl_str = os.getenv('REDIS_SSL', 'False')
     redis_ssl = redis_ssl_str.lower() == 'true'
+    redis_pool_size = os.getenv('REDIS_POOL')
 
-    logger.info(f"Initializing Redis connection to {redis_host}:{redis_port}")
+    logger.info(f"Initializing Redis connection to {redis_host}:{redis_port} (pool size: {redis_pool_size or 'unbounded'})")
 
-    # Create Redis client with basic configuration
-    client = redis.Redis(
+    # Single connection pool shared by every consumer in this process so
+    # concurrent coroutines get their own in-flight connection
+    connection_kwargs = dict(
+        connection_class=redis.SSLConnection if redis_ssl else redis.Connection,
         host=redis_host,
         port=redis_port,
         password=redis_password,
-        ssl=redis_ssl,
         decode_responses=True,
         socket_timeout=5.0,
         socket_connect_timeout=5.0,
         retry_on_timeout=True,
         health_check_interval=30
     )
+    if redis_pool_size:
+        # Pubsub subscribers hold a connection for as long as they are
+        # subscribed (two per SSE stream, one per background run), so the cap
+        # must leave headroom above them. Wait for a free connection instead
+        # of failing with "Too many connections" when it is reached.
+        pool = redis.BlockingConnectionPool(
+            max_connections=int(redis_pool_size),
+            timeout=REDIS_POOL_TIMEOUT,
+            **connection_kwargs
+        )
+    else:
+        # Unbounded, matching redis-py's default
+        pool = redis.ConnectionPool(**connection_kwargs)
+
+    # Create Redis client on top of the shared pool
+    client = redis.Redis(connection_pool=pool)
 
     return client
 
 
 async def initialize_async():
     """Initialize Redis connection asynchronously."""
-    global client, _initialized
+    global client, _initialized, _ready_client
 
     async with _init_lock:
         if not _initialized:
@@ -60,6 +82,7 @@ async def initialize_async():
                 await client.ping()
                 logger.info("Successfully connected to Redis")
                 _initialized = True
+                _ready_client = client
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {e}")
                 client = None
@@ -70,12 +93,17 @@ async def initialize_async():
 
 async def close():
     """Close Redis connection."""
-    global client, _initialized
+    global client, pool, _initialized, _ready_client
     if client:
         logger.info("Closing Redis connection")
+        _ready_client = None
         await client.aclose()
         client = None
         _initialized = False
+        if pool:
+            # The client does not own an externally supplied pool
+            await pool.disconnect()
+            pool = None
         logger.info("Redis connection closed")
 
 
@@ -90,64 +118,99 @@ async def get_client():
 # Basic Redis operations
 async def set(key: str, value: str, ex: int = None):
     """Set a Redis key."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.set(key, value, ex=ex)
 
 
 async def get(key: str, default: str = None):
     """Get a Redis key."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     result = await redis_client.get(key)
     return result if result is not None else default
 
 
 async def delete(key: str):
     """Delete a Redis key."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.delete(key)
 
 
 async def publish(channel: str, message: str):
     """Publish a message to a Redis channel."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.publish(channel, message)
 
 
 async def create_pubsub():
     """Create a Redis pubsub object."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return redis_client.pubsub()
 
 
+# Batch operations
+async def mget(keys: List[str]) -> List[Any]:
+    """Get multiple Redis keys in a single round trip."""
+    if not keys:
+        return []
+    redis_client = _ready_client or await get_client()
+    return await redis_client.mget(keys)
+
+
+async def mset(mapping: Dict[str, str], ex: int = None):
+    """Set multiple Redis keys; with an expiry, pipelined per batch."""
+    if not mapping:
+        return
+    redis_client = _ready_client or await get_client()
+    if ex is None:
+        # Native MSET covers every key in one command
+        return await redis_client.mset(mapping)
+    items = list(mapping.items())
+    for i in range(0, len(items), REDIS_BATCH_SIZE):
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key, value in items[i:i + REDIS_BATCH_SIZE]:
+                pipe.set(key, value, ex=ex)
+            await pipe.execute()
+
+
+async def mdelete(keys: Iterable[str]) -> int:
+    """Delete multiple Redis keys with one multi-key DEL per batch."""
+    redis_client = _ready_client or await get_client()
+    keys = list(keys)
+    deleted = 0
+    for i in range(0, len(keys), REDIS_BATCH_SIZE):
+        deleted += await redis_client.delete(*keys[i:i + REDIS_BATCH_SIZE])
+    return deleted
+
+
 # List operations
 async def rpush(key: str, *values: Any):
     """Append one or more values to a list."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.rpush(key, *values)
 
 
 async def lrange(key: str, start: int, end: int) -> List[str]:
     """Get a range of elements from a list."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.lrange(key, start, end)
 
 
 async def llen(key: str) -> int:
     """Get the length of a list."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.llen(key)
 
 
 # Key management
 async def expire(key: str, time: int):
     """Set a key's time to live in seconds."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.expire(key, time)
 
 
 async def keys(pattern: str) -> List[str]:
     """Get keys matching a pattern."""
-    redis_client = await get_client()
+    redis_client = _ready_client or await get_client()
     return await redis_client.keys(pattern)
 
 
@@ -179,21 +242,51 @@ class RedisClient:
         client = await self._ensure_client()
         return await client.delete(*keys)
     
-    async def scan_iter(self, match: str = None, count: int = 100):
-        """Scan keys matching a pattern."""
+    async def mget(self, keys: List[str]) -> List[Any]:
+        """Get multiple values in a single round trip."""
+        return await mget(keys)
+    
+    async def mset(self, items: Dict[str, str], ex: int = None) -> None:
+        """Set multiple values with optional expiration."""
+        await mset(items, ex=ex)
+    
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete many keys with one multi-key DEL per batch."""
+        return await mdelete(keys)
+    
+    async def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        """Increment a hash field by the given amount."""
+        client = await self._ensure_client()
+        return await client.hincrby(key, field, amount)
+    
+    async def hgetall(self, key: str) -> dict:
+        """Get all fields and values of a hash."""
+        client = await self._ensure_client()
+        return await client.hgetall(key)
+    
+    async def smembers(self, key: str) -> set:
+        """Get all members of a set."""
+        client = await self._ensure_client()
+        return await client.smembers(key)
+    
+    async def pipeline(self, transaction: bool = True):
+        """Create a pipeline for batching commands into one round trip."""
+        client = await self._ensure_client()
+        return client.pipeline(transaction=transaction)
+    
+    async def scan_iter(self, match: str = None, count: int = 500):
+        """Scan keys matching a pattern, yielding them as each batch arrives."""
         client = await self._ensure_client()
         cursor = 0
-        keys = []
         
-        # Use scan to get keys matching pattern
+        # Use scan to stream keys matching pattern
         while True:
             cursor, batch_keys = await client.scan(cursor, match=match, count=count)
-            keys.extend(batch_keys)
+            for key in batch_keys:
+                yield key
             
             if cursor == 0:
                 break
-        
-        return keys
 
 
 # Global Redis client instance for tool cache
@@ -0,0 +1,40 @@
+-- Billing report for a single user in one round trip
+-- Used by utils/scripts/check_user_billing.py in place of separate profile,
+-- auth user and subscription lookups
+CREATE OR REPLACE FUNCTION public.user_billing_report(uid uuid)
+    RETURNS jsonb
+    LANGUAGE sql
+    STABLE
+    SECURITY DEFINER
+    SET search_path = public, basejump
+AS $$
+    SELECT jsonb_build_object(
+        'profile', (
+            SELECT to_jsonb(p)
+            FROM public.profiles p
+            WHERE p.id = uid
+        ),
+        'auth_user', (
+            SELECT jsonb_build_object('email', u.email, 'created_at', u.created_at)
+            FROM auth.users u
+            WHERE u.id = uid
+        ),
+        'subscriptions', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', s.id,
+                    'status', s.status,
+                    'price_id', s.price_id,
+                    'plan_name', s.plan_name,
+                    'created', s.created
+                ) ORDER BY s.created DESC
+            )
+            FROM basejump.billing_subscriptions s
+            WHERE s.account_id = uid
+        ), '[]'::jsonb)
+    );
+$$;
+
+-- Reads auth.users, so keep it service-role only
+REVOKE EXECUTE ON FUNCTION public.user_billing_report(uuid) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.user_billing_report(uuid) TO service_role;
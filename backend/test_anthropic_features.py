@@ -10,6 +10,15 @@ import os
 from services.llm import make_llm_api_call
 from utils.logger import logger
 
+try:
+    # Faster libuv-based event loop where available (not on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Bound concurrent Anthropic calls to stay under the account's rate limits
+api_semaphore = asyncio.Semaphore(int(os.getenv('ANTHROPIC_NUM_PARALLEL', '3')))
+
 async def test_thinking_budget():
     """Test the new thinking_budget_tokens parameter"""
     logger.info("Testing thinking_budget_tokens...")
@@ -19,13 +28,14 @@ async def test_thinking_budget():
     ]
     
     try:
-        response = await make_llm_api_call(
-            messages,
-            "anthropic/claude-3-opus-latest",
-            enable_thinking=True,
-            thinking_budget_tokens=500,  # Using new API
-            stream=False
-        )
+        async with api_semaphore:
+            response = await make_llm_api_call(
+                messages,
+                "anthropic/claude-3-opus-latest",
+                enable_thinking=True,
+                thinking_budget_tokens=500,  # Using new API
+                stream=False
+            )
         
         logger.info("✅ thinking_budget_tokens test passed!")
         logger.info(f"Response: {response.choices[0].message.content[:100]}...")
@@ -43,12 +53,13 @@ async def test_native_web_search():
     ]
     
     try:
-        response = await make_llm_api_call(
-            messages,
-            "anthropic/claude-3-opus-latest", 
-            enable_native_web_search=True,
-            stream=False
-        )
+        async with api_semaphore:
+            response = await make_llm_api_call(
+                messages,
+                "anthropic/claude-3-opus-latest", 
+                enable_native_web_search=True,
+                stream=False
+            )
         
         logger.info("✅ enable_native_web_search test passed!")
         logger.info(f"Response: {response.choices[0].message.content[:100]}...")
@@ -66,14 +77,15 @@ async def test_both_features():
     ]
     
     try:
-        response = await make_llm_api_call(
-            messages,
-            "anthropic/claude-3-opus-latest",
-            enable_thinking=True,
-            thinking_budget_tokens=1000,
-            enable_native_web_search=True,
-            stream=False
-        )
+        async with api_semaphore:
+            response = await make_llm_api_call(
+                messages,
+                "anthropic/claude-3-opus-latest",
+                enable_thinking=True,
+                thinking_budget_tokens=1000,
+                enable_native_web_search=True,
+                stream=False
+            )
         
         logger.info("✅ Combined features test passed!")
         logger.info(f"Response: {response.choices[0].message.content[:100]}...")
@@ -91,16 +103,14 @@ async def main():
         logger.error("ANTHROPIC_API_KEY not set!")
         return
     
-    results = []
-    
-    # Test thinking budget
-    results.append(await test_thinking_budget())
-    
-    # Test native web search
-    results.append(await test_native_web_search())
-    
-    # Test both together
-    results.append(await test_both_features())
+    # The tests share no state, so overlap their API round trips
+    results = await asyncio.gather(
+        test_thinking_budget(),
+        test_native_web_search(),
+        test_both_features(),
+        return_exceptions=True
+    )
+    results = [result is True for result in results]
     
     # Summary
     passed = sum(results)
@@ -116,4 +126,4 @@ async def main():
         logger.error("❌ Some tests failed!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    (getattr(uvloop, 'run', None) or asyncio.run)(main())
\ No newline at end of file
@@ -1,25 +1,8 @@
-#!/usr/bin/env python3
-"""Test script to verify langfuse imports work correctly"""
+"""Verify the langfuse service imports and exposes a usable client."""
 
-print("Testing langfuse imports...")
+from services.langfuse import langfuse
 
-try:
-    from services.langfuse import langfuse
-    print("✅ Successfully imported langfuse service")
-    
-    # Test the type hints we're using
-    from typing import Any
-    StatefulTraceClient = Any
-    StatefulGenerationClient = Any
-    print("✅ Type hints set up correctly")
-    
-    # Check if langfuse is enabled
-    if hasattr(langfuse, 'enabled'):
-        print(f"ℹ️  Langfuse enabled: {langfuse.enabled}")
-    
-    print("\n✅ All imports successful! The backend should start now.")
-    
-except Exception as e:
-    print(f"❌ Import failed: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+
+def test_langfuse_importable():
+    assert langfuse is not None
+    assert callable(langfuse.trace)
@@ -6,11 +6,18 @@ Valid tiers: free, creator, tester, vip, investor
 """
 import asyncio
 import sys
-from supabase import create_client
-from utils.config import config
+from services.supabase import DBConnection
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 VALID_TIERS = ['free', 'creator', 'tester', 'vip', 'investor']
 
+# Shared DB connection, reused across calls in this process
+db = DBConnection()
+
 async def update_user_tier(user_id: str, tier: str):
     """Update a user's tier."""
     if tier not in VALID_TIERS:
@@ -18,35 +25,29 @@ async def update_user_tier(user_id: str, tier: str):
         print(f"Valid tiers: {', '.join(VALID_TIERS)}")
         return
     
-    client = create_client(config.SUPABASE_URL, config.SUPABASE_SERVICE_KEY)
+    client = await db.client
     
     print(f"\n=== Updating user tier ===")
     print(f"User ID: {user_id}")
     print(f"New tier: {tier}")
     
     try:
-        # Check if profile exists
-        profile = await client.table('profiles').select('*').eq('id', user_id).single()
+        # Single upsert: updates the tier if the profile exists, creates it
+        # otherwise, and returns the resulting row for verification
+        result = await client.table('profiles').upsert({
+            'id': user_id,
+            'user_tier': tier
+        }, on_conflict='id').execute()
         
-        if profile.data:
-            # Update existing profile
-            result = await client.table('profiles').update({'user_tier': tier}).eq('id', user_id).execute()
-            print(f"✅ Updated existing profile to tier: {tier}")
-        else:
-            # Create new profile
-            result = await client.table('profiles').insert({
-                'id': user_id,
-                'user_tier': tier
-            }).execute()
-            print(f"✅ Created new profile with tier: {tier}")
-        
-        # Verify the update
-        verify = await client.table('profiles').select('*').eq('id', user_id).single()
-        if verify.data:
+        if result.data:
+            print(f"✅ Set profile tier to: {tier}")
+            profile = result.data[0]
             print(f"\nVerification:")
-            print(f"  User ID: {verify.data.get('id')}")
-            print(f"  Tier: {verify.data.get('user_tier')}")
-            print(f"  Email: {verify.data.get('email', 'N/A')}")
+            print(f"  User ID: {profile.get('id')}")
+            print(f"  Tier: {profile.get('user_tier')}")
+            print(f"  Email: {profile.get('email', 'N/A')}")
+        else:
+            print(f"❌ Upsert returned no profile for user: {user_id}")
         
     except Exception as e:
         print(f"❌ Error updating tier: {e}")
@@ -59,4 +60,4 @@ if __name__ == "__main__":
     
     user_id = sys.argv[1]
     tier = sys.argv[2]
-    asyncio.run(update_user_tier(user_id, tier))
\ No newline at end of file
+    (getattr(uvloop, 'run', None) or asyncio.run)(update_user_tier(user_id, tier))
\ No newline at end of file